@@ -2,190 +2,482 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from threading import Thread, Event
 import os
+import sys
+import csv
 import zipfile
-import requests
-import pandas as pd
+import shutil
+import tempfile
+import itertools
+import urllib.parse
+import urllib.request
+import urllib3
 from lxml import etree
+from stream_unzip import stream_unzip
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import multiprocessing
+import time
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # === Global state ===
 cancel_flag = Event()
 last_extract_dir = None
 
-def parse_xml_file(file_path: str) -> list[dict]:
-    tree = etree.parse(file_path)
-    root = tree.getroot()
-
-    ns = {'g': 'http://www.fda.gov/cdrh/gudid'}
-
-    results = []
-    devices = root.findall('.//g:device', namespaces=ns)
-    print(f"[DEBUG] Found {len(devices)} devices in: {file_path}")
-
-    for device in devices:
-        def find_text(path):
-            element = device.find(path, namespaces=ns)
-            return element.text.strip() if element is not None and element.text else None
-
-        row = {
-            'deviceId': find_text('g:identifiers/g:identifier/g:deviceId'),
-            'versionModelNumber': find_text('g:versionModelNumber'),
-            'catalogNumber': find_text('g:catalogNumber'),
-            'dunsNumber': find_text('g:dunsNumber'),
-            'companyName': find_text('g:companyName'),
-            'deviceDescription': find_text('g:deviceDescription'),
-            'singleUse': find_text('g:singleUse'),
-            'lotBatch': find_text('g:lotBatch'),
-            'serialNumber': find_text('g:serialNumber')
-        }
+# === Logging ===
+# During a run, download_and_process_zip routes records through a queue
+# into a per-run file, so processing never waits on the log file. Records
+# logged between runs are not kept for the next run's file.
+# Per-file messages are DEBUG and only show up if the level is lowered.
+logger = logging.getLogger("Greatbatch")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Progress shown in the window. Worker threads only assign these; the Tk
+# thread picks them up periodically in _refresh_ui.
+_status_text = "Idle"
+_progress_value = 0
+_progress_maximum = 100
+_pending_dialog = None  # (messagebox function, title, message) to show once
+
+class DeviceRow(NamedTuple):
+    deviceId: str | None
+    versionModelNumber: str | None
+    catalogNumber: str | None
+    dunsNumber: str | None
+    companyName: str | None
+    deviceDescription: str | None
+    singleUse: str | None
+    lotBatch: str | None
+    serialNumber: str | None
+
+FIELDNAMES = list(DeviceRow._fields)
+
+_NS = {'g': 'http://www.fda.gov/cdrh/gudid'}
+_DEVICE_TAG = '{%s}device' % _NS['g']
+
+def _build_field_tree():
+    # Tag trie of the output column paths below <device>. Each node maps a
+    # qualified tag to (DeviceRow position or None, child node), so the
+    # parser target can follow elements without building path keys.
+    tree = {}
+    for field, path in (
+        ('deviceId', 'identifiers/identifier/deviceId'),
+        ('versionModelNumber', 'versionModelNumber'),
+        ('catalogNumber', 'catalogNumber'),
+        ('dunsNumber', 'dunsNumber'),
+        ('companyName', 'companyName'),
+        ('deviceDescription', 'deviceDescription'),
+        ('singleUse', 'singleUse'),
+        ('lotBatch', 'lotBatch'),
+        ('serialNumber', 'serialNumber'),
+    ):
+        node = tree
+        *parents, leaf = ['{%s}%s' % (_NS['g'], tag) for tag in path.split('/')]
+        for tag in parents:
+            node = node.setdefault(tag, (None, {}))[1]
+        node[leaf] = (FIELDNAMES.index(field), node.get(leaf, (None, {}))[1])
+    return tree
+
+_FIELD_TREE = _build_field_tree()
+_NO_FIELD = (None, {})
+
+class DeviceTarget:
+    """lxml parser target that emits device rows from SAX-style events.
+
+    No Element objects are ever built; each DeviceRow is handed to writerow
+    as soon as its </device> is seen, and close() returns the number of rows.
+    GUDID places <device> directly under the root <gudid> element, so only
+    that depth is considered rather than searching every descendant. Like
+    Element.find(), only the first match of each field path within a
+    <device> is kept, and its leading text is stripped (None when the
+    element has no text).
+    """
+
+    def __init__(self, writerow):
+        self._writerow = writerow
+        self._count = 0
+        self._depth = 0     # open elements outside any <device>
+        self._nodes = None  # _FIELD_TREE node per open element in a <device>
+        self._values = None
+        self._seen = 0      # bit per DeviceRow position already captured
+        self._capture = None
+        self._capture_depth = 0
+        self._text = []
+        self._text_done = False
+
+    def start(self, tag, attrib):
+        if self._nodes is None:
+            if self._depth == 1 and tag == _DEVICE_TAG:
+                self._nodes = [_FIELD_TREE]
+                self._values = [None] * len(FIELDNAMES)
+                self._seen = 0
+            else:
+                self._depth += 1
+            return
 
-        results.append(row)
+        index, children = self._nodes[-1].get(tag, _NO_FIELD)
+        self._nodes.append(children)
+        if self._capture is not None:
+            # Element.text stops at the first child element
+            self._text_done = True
+            return
+        if index is not None and not self._seen & (1 << index):
+            self._capture = index
+            self._capture_depth = len(self._nodes)
+            self._text = []
+            self._text_done = False
+
+    def data(self, text):
+        if self._capture is not None and not self._text_done:
+            self._text.append(text)
+
+    def end(self, tag):
+        if self._nodes is None:
+            self._depth -= 1
+            return
 
-    return results
+        if len(self._nodes) == 1:
+            # </device>
+            self._writerow(DeviceRow._make(self._values))
+            self._count += 1
+            self._nodes = self._values = None
+            return
 
-def write_split_csv(rows, output_path):
+        if self._capture is not None and len(self._nodes) == self._capture_depth:
+            text = ''.join(self._text)
+            self._values[self._capture] = text.strip() if text else None
+            self._seen |= 1 << self._capture
+            self._capture = None
+        self._nodes.pop()
+
+    def close(self):
+        return self._count
+
+def _open_shard(shard_path):
+    return open(shard_path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+
+def _device_parser(out):
+    target = DeviceTarget(csv.writer(out).writerow)
+    return etree.XMLParser(target=target, collect_ids=False, huge_tree=True)
+
+def parse_xml_file(zip_path: str, member: str, shard_path: str) -> int:
+    """Parse one ZIP member into a header-less CSV shard; return its row count.
+
+    Rows go straight to disk from the worker, so nothing but the count is
+    sent back to the parent process. Each call opens its own ZipFile handle,
+    as a shared one cannot be used across worker processes.
+    """
+    with zipfile.ZipFile(zip_path) as zf, zf.open(member) as fh:
+        # Pushing 1 MiB blocks into the parser is cheaper than letting lxml
+        # pull many small reads from fh through Python
+        return parse_xml_stream(iter(lambda: fh.read(1 << 20), b''), shard_path)
+
+def parse_spooled_xml(xml_path: str, shard_path: str) -> int:
+    """Parse an XML file spooled to disk during download, then delete it."""
+    try:
+        with open(xml_path, 'rb') as fh:
+            return parse_xml_stream(iter(lambda: fh.read(1 << 20), b''), shard_path)
+    finally:
+        os.remove(xml_path)
+
+def parse_xml_stream(chunks, shard_path: str) -> int:
+    """Parse a document arriving as byte chunks into a CSV shard."""
+    with _open_shard(shard_path) as out:
+        parser = _device_parser(out)
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+            return parser.close()
+        except etree.XMLSyntaxError as e:
+            # lxml's error carries an error log that cannot be pickled
+            # back to the parent process
+            raise ValueError(str(e)) from None
+
+def write_split_csv(shards, output_path):
+    """Concatenate CSV shards into parts of at most 500000 rows each.
+
+    shards holds (path, row_count) pairs for header-less CSV files. A shard
+    that fits in the current part is copied byte for byte; one that crosses
+    a part boundary is split with csv.reader, as fields may contain newlines.
+    If every row fits in one part it is written to output_path; otherwise
+    parts are written as <base>_<n><ext>.
+    """
     base, ext = os.path.splitext(output_path)
     chunk_size = 500000
-    total_rows = len(rows)
-    num_chunks = (total_rows // chunk_size) + (1 if total_rows % chunk_size else 0)
-
-    for i in range(num_chunks):
-        chunk = rows[i * chunk_size : (i + 1) * chunk_size]
-        df = pd.DataFrame(chunk)
-        if num_chunks == 1:
-            filename = output_path
-        else:
-            filename = f"{base}_{i+1}{ext}"
-        df.to_csv(filename, index=False)
-        logging.info("Wrote %d rows to: %s", len(chunk), filename)
+    single = sum(count for _, count in shards) <= chunk_size
+    parts = []
+    f = writer = None
+    room = 0
+
+    try:
+        for shard_path, remaining in shards:
+            with open(shard_path, 'r', newline='', encoding='utf-8') as src:
+                rows = None
+                while remaining:
+                    if not room:
+                        if f is not None:
+                            f.close()
+                        filename = output_path if single else f"{base}_{len(parts)+1}{ext}"
+                        parts.append([filename, 0])
+                        f = open(parts[-1][0], 'w', newline='', encoding='utf-8', buffering=1 << 20)
+                        writer = csv.writer(f)
+                        writer.writerow(FIELDNAMES)
+                        room = chunk_size
+                    if rows is None and remaining <= room:
+                        f.flush()
+                        shutil.copyfileobj(src.buffer, f.buffer, 1 << 20)
+                        count = remaining
+                    else:
+                        if rows is None:
+                            rows = csv.reader(src)
+                        count = min(room, remaining)
+                        writer.writerows(itertools.islice(rows, count))
+                    parts[-1][1] += count
+                    room -= count
+                    remaining -= count
+    finally:
+        if f is not None:
+            f.close()
+
+    for filename, count in parts:
+        logger.info("Wrote %d rows to: %s", count, filename)
 
 input_mode = None
 local_zip_path = None
 
 
-def download_and_process_zip(url, local_path, mode, extract_dir, output_csv, progressbar, status_label):
-    try:
-        cancel_flag.clear()
-
-        # === Log file setup ===
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = os.path.join(extract_dir, f"GreatbatchLog_{timestamp}.log")
-        logging.basicConfig(
-            filename=log_filename,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-        logging.info("=== Starting processing ===")
-
-        if mode == "download":
-            set_status(status_label, "Downloading ZIP...")
-            logging.info("Download URL: %s", url)
-            progressbar.config(mode='determinate')
-            zip_path = os.path.join(extract_dir, "downloaded.zip")
-
-            with requests.get(url, stream=True) as response:
-                response.raise_for_status()
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
-                chunk_size = 8192
-                progressbar["maximum"] = total_size
-
-                with open(zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if cancel_flag.is_set():
-                            set_status(status_label, "Cancelled during download")
-                            logging.warning("Cancelled during download")
-                            return
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        progressbar["value"] = downloaded
-                        progressbar.update_idletasks()
-                        set_status(status_label, f"Downloading... {downloaded / (1024*1024):.2f} MB / {total_size / (1024*1024):.2f} MB")
-        else:
-            zip_path = local_path
-            if not os.path.isfile(zip_path):
-                set_status(status_label, "Invalid local ZIP path")
-                logging.error("Invalid local ZIP path: %s", zip_path)
-                return
-            logging.info("Using local ZIP file: %s", zip_path)
-            set_status(status_label, f"Using local file: {os.path.basename(zip_path)}")
+def _pool_manager(url):
+    # urllib3 does not look at proxy settings itself, so use the same ones
+    # requests would: HTTP(S)_PROXY/NO_PROXY, or the system configuration
+    # on Windows and macOS when those are not set
+    parts = urllib.parse.urlsplit(url)
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ''):
+        return urllib3.PoolManager()
+    auth = urllib3.util.parse_url(proxy).auth
+    headers = urllib3.make_headers(proxy_basic_auth=urllib.parse.unquote(auth)) if auth else None
+    return urllib3.ProxyManager(proxy, proxy_headers=headers)
+
+def _is_xml(name):
+    return name.endswith(".xml")
+
+def stream_download_zip(url, shard_dir, shards):
+    """Download the ZIP and parse its XML members while the rest arrives.
+
+    The archive is unzipped from the response stream and each XML member is
+    spooled to shard_dir; once a member is complete it is handed to the
+    parse pool, so parsing overlaps the remainder of the download. Spooled
+    members are deleted as soon as they are parsed, and (path, row_count)
+    pairs are appended to shards. Returns False if the run was cancelled.
+    """
+    set_status("Downloading ZIP...")
+    logger.info("Download URL: %s", url)
+    futures = {}
+
+    # Read the raw urllib3 stream rather than going through requests'
+    # iter_content, which re-chunks in Python on top of urllib3's own reads
+    http = _pool_manager(url)
+    with http.request('GET', url, preload_content=False) as response:
+        if response.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"{response.status} {response.reason} for url: {url}")
+        total_size = int(response.headers.get('content-length', 0))
+        set_progress(0, total_size)
+
+        def zipped_chunks():
+            downloaded = 0
+            last_ui = 0.0
+            for chunk in response.stream(1 << 20):
+                if cancel_flag.is_set():
+                    return
+                yield chunk
+                downloaded += len(chunk)
+                # Refresh the UI at most ~10 times per second
+                now = time.monotonic()
+                if now - last_ui > 0.1 or downloaded == total_size:
+                    last_ui = now
+                    set_progress(downloaded)
+                    parsed = sum(future.done() for future in futures)
+                    set_status(f"Downloading... {downloaded / (1024*1024):.2f} MB / {total_size / (1024*1024):.2f} MB, parsed {parsed} files")
+
+        with _parse_executor() as executor:
+            try:
+                for name, size, chunks in stream_unzip(zipped_chunks()):
+                    name = name.decode('utf-8', 'replace')
+                    if not _is_xml(name):
+                        # Members must be fully consumed before stream_unzip moves on
+                        for _ in chunks:
+                            pass
+                        continue
+                    i = len(futures)
+                    xml_path = os.path.join(shard_dir, f"member_{i}.xml")
+                    with open(xml_path, 'wb') as spool:
+                        for chunk in chunks:
+                            spool.write(chunk)
+                    shard_path = os.path.join(shard_dir, f"shard_{i}.csv")
+                    futures[executor.submit(parse_spooled_xml, xml_path, shard_path)] = (name, shard_path)
+            except Exception:
+                # Stopping the download part-way leaves a truncated archive
+                if not cancel_flag.is_set():
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
 
-        # === Extract ZIP ===
-        set_status(status_label, "Extracting ZIP...")
-        logging.info("Extracting ZIP")
-        total_unzipped_size = 0
-        progressbar.config(mode='indeterminate')
-        progressbar.start()
+            if cancel_flag.is_set():
+                executor.shutdown(wait=False, cancel_futures=True)
+                set_status("Cancelled during download")
+                logger.warning("Cancelled during download")
+                return False
+
+            logger.info("Found %d XML files", len(futures))
+            return _collect_parsed(executor, futures, shards)
+
+def _parse_executor():
+    # On a free-threaded build (e.g. python3.13t) with the GIL really off,
+    # threads parse in parallel without spawning workers or pickling. The
+    # interpreter turns the GIL back on if an extension such as lxml is not
+    # marked free-thread safe, in which case processes are still used.
+    cpus = os.cpu_count() or 4
+    if not getattr(sys, '_is_gil_enabled', lambda: True)():
+        return ThreadPoolExecutor(max_workers=cpus + cpus // 2)
+    # max_workers=None lets the stdlib use the CPU count, capped at the 61
+    # workers Windows allows; passing a larger count raises ValueError there
+    return ProcessPoolExecutor(max_workers=None)
+
+def parse_local_zip(zip_path, shard_dir, shards):
+    """Parse every XML member of a ZIP on disk across parallel workers.
+
+    Each worker writes its own CSV shard into shard_dir, and (path,
+    row_count) pairs are appended to shards as they finish. Returns False
+    if the run was cancelled or the ZIP could not be read.
+    """
+    logger.info("Using local ZIP file: %s", zip_path)
+    set_status(f"Using local file: {os.path.basename(zip_path)}")
+
+    # === Read ZIP ===
+    # Members are parsed straight out of the archive by the workers, so
+    # nothing is extracted to disk; only the member list is read here.
+    set_status("Reading ZIP...")
+    logger.info("Reading ZIP: %s", zip_path)
 
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = [m for m in zip_ref.infolist() if _is_xml(m.filename)]
+    except Exception as e:
+        logger.exception("Error reading ZIP")
+        set_status("Reading ZIP failed")
+        return False
+
+    total_unzipped_size = sum(m.file_size for m in members)
+    logger.info("XML payload: %.2f MB", total_unzipped_size / (1024 * 1024))
+
+    # === Parse XML files ===
+    # Largest members are submitted first so a big file picked up last does
+    # not keep one worker busy while the others sit idle.
+    set_status("Parsing XML files...")
+    members.sort(key=lambda m: m.file_size, reverse=True)
+    files = [m.filename for m in members]
+    logger.info("Found %d XML files", len(files))
+
+    # Row building is pure Python, so with the GIL on files are parsed in
+    # separate processes. cancel_flag cannot cross the process boundary;
+    # it is checked here instead and pending files are dropped on cancel.
+    with _parse_executor() as executor:
+        futures = {}
+        for i, f in enumerate(files):
+            shard_path = os.path.join(shard_dir, f"shard_{i}.csv")
+            futures[executor.submit(parse_xml_file, zip_path, f, shard_path)] = (f, shard_path)
+        return _collect_parsed(executor, futures, shards)
+
+def _collect_parsed(executor, futures, shards):
+    # Waits for the parse jobs in futures (mapped to (name, shard_path)),
+    # appending each finished shard to shards. Returns False on cancel.
+    total = len(futures)
+    set_progress(0, total)
+    completed = failed = 0
+    for future in as_completed(futures):
+        if cancel_flag.is_set():
+            executor.shutdown(wait=False, cancel_futures=True)
+            set_status("Cancelled during parsing")
+            logger.warning("Cancelled during parsing")
+            return False
+        name, shard_path = futures[future]
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-                for file_info in zip_ref.infolist():
-                    total_unzipped_size += file_info.file_size
+            count = future.result()
+            shards.append((shard_path, count))
+            logger.debug("Parsed file: %s (%d devices)", name, count)
         except Exception as e:
-            logging.exception("Error during ZIP extraction")
-            set_status(status_label, "Extraction failed")
-            return
+            failed += 1
+            logger.exception("Error parsing file: %s", name)
+        completed += 1
+        set_progress(completed)
+        set_status(f"Parsed {completed}/{total} files")
 
-        progressbar.stop()
-        set_status(status_label, f"Extracted: {total_unzipped_size / (1024 * 1024):.2f} MB")
-        logging.info("Extraction complete: %.2f MB", total_unzipped_size / (1024 * 1024))
+    logger.info("Parsed %d XML files, %d failed", completed - failed, failed)
+    return True
 
-        # === Parse XML files ===
-        set_status(status_label, "Parsing XML files...")
-        files = [f for f in os.listdir(extract_dir) if f.endswith(".xml")]
-        total = len(files)
-        progressbar.config(mode='determinate', maximum=total, value=0)
-        logging.info("Found %d XML files", total)
-        rows = []
+def download_and_process_zip(url, local_path, mode, extract_dir, output_csv):
+    log_listener = queue_handler = None
+    try:
+        cancel_flag.clear()
 
-        def worker(file_path):
-            if cancel_flag.is_set():
-                return []
-            return parse_xml_file(file_path)
+        # === Log file setup ===
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_filename = os.path.join(extract_dir, f"GreatbatchLog_{timestamp}.log")
+        log_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        log_queue = queue.SimpleQueue()
+        log_listener = QueueListener(log_queue, log_handler)
+        log_listener.start()
+        queue_handler = QueueHandler(log_queue)
+        logger.addHandler(queue_handler)
+        logger.info("=== Starting processing ===")
+
+        if mode != "download" and not os.path.isfile(local_path):
+            set_status("Invalid local ZIP path")
+            logger.error("Invalid local ZIP path: %s", local_path)
+            return
 
-        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
-            futures = {
-                executor.submit(worker, os.path.join(extract_dir, f)): f for f in files
-            }
+        # Parsers write their rows to per-file CSV shards in a scratch folder;
+        # these are only concatenated into the output once every file has
+        # been parsed, and the folder is removed however the run ends.
+        shard_dir = tempfile.mkdtemp(prefix="shards_", dir=extract_dir)
+        shards = []
 
-            completed = 0
-            for future in as_completed(futures):
-                if cancel_flag.is_set():
-                    set_status(status_label, "Cancelled during parsing")
-                    logging.warning("Cancelled during parsing")
-                    return
-                try:
-                    result = future.result()
-                    rows.extend(result)
-                    logging.info("Parsed file: %s", futures[future])
-                except Exception as e:
-                    logging.exception("Error parsing file: %s", futures[future])
-                completed += 1
-                progressbar["value"] = completed
-                progressbar.update_idletasks()
-                set_status(status_label, f"Parsed {completed}/{total} files")
-
-        # === Output CSV ===
-        set_status(status_label, "Writing CSV...")
         try:
-            write_split_csv(rows, output_csv)
-        except Exception as e:
-            logging.exception("Error writing CSV")
-            set_status(status_label, "CSV write failed")
-            return
+            if mode == "download":
+                finished = stream_download_zip(url, shard_dir, shards)
+            else:
+                finished = parse_local_zip(local_path, shard_dir, shards)
+            if not finished:
+                return
+
+            # === Output CSV ===
+            set_status("Writing CSV...")
+            try:
+                write_split_csv(shards, output_csv)
+            except Exception as e:
+                logger.exception("Error writing CSV")
+                set_status("CSV write failed")
+                return
+        finally:
+            shutil.rmtree(shard_dir, ignore_errors=True)
 
-        set_status(status_label, f"Done! Saved to {output_csv}")
-        root.after(0, lambda: messagebox.showinfo("Done", f"CSV written to: {output_csv}"))
-        logging.info("=== Processing complete ===")
+        set_status(f"Done! Saved to {output_csv}")
+        show_dialog(messagebox.showinfo, "Done", f"CSV written to: {output_csv}")
+        logger.info("=== Processing complete ===")
 
     except Exception as e:
-        progressbar.stop()
-        set_status(status_label, "Error")
-        logging.exception("Processing failed")
-        messagebox.showerror("Error", str(e))
+        set_status("Error")
+        logger.exception("Processing failed")
+        show_dialog(messagebox.showerror, "Error", str(e))
+    finally:
+        if queue_handler is not None:
+            logger.removeHandler(queue_handler)
+        if log_listener is not None:
+            log_listener.stop()
+            log_handler.close()
 
 def run_processing():
     global last_extract_dir
@@ -198,11 +490,11 @@ def run_processing():
         last_extract_dir = extract_folder
         cleanup_btn.config(state=tk.NORMAL)
         Thread(target=download_and_process_zip, args=(
-            url, local_zip_path.get(), input_mode.get(), extract_folder, output, progress, status_label)).start()
+            url, local_zip_path.get(), input_mode.get(), extract_folder, output)).start()
 
 def cancel_process():
     cancel_flag.set()
-    set_status(status_label, "Cancelling...")
+    set_status("Cancelling...")
 
 def clean_up():
     if not last_extract_dir or not os.path.isdir(last_extract_dir):
@@ -210,25 +502,48 @@ def clean_up():
         return
 
     deleted = 0
-    for file in os.listdir(last_extract_dir):
-        if file == "downloaded.zip" or file.endswith(".xml"):
-            try:
-                os.remove(os.path.join(last_extract_dir, file))
-                deleted += 1
-            except Exception as e:
-                logging.exception("Error deleting file: %s", file)
+    with os.scandir(last_extract_dir) as entries:
+        for entry in entries:
+            if entry.name == "downloaded.zip" or _is_xml(entry.name):
+                try:
+                    os.unlink(entry.path)
+                    deleted += 1
+                except Exception as e:
+                    logger.exception("Error deleting file: %s", entry.name)
     messagebox.showinfo("Cleanup", f"Deleted {deleted} file(s) from:\n{last_extract_dir}")
 
-def set_status(label, text):
-    label.config(text=text)
-    label.update_idletasks()
+def set_status(text):
+    global _status_text
+    _status_text = text
+
+def set_progress(value, maximum=None):
+    global _progress_value, _progress_maximum
+    if maximum is not None:
+        _progress_maximum = maximum
+    _progress_value = value
+
+def show_dialog(show, title, message):
+    global _pending_dialog
+    _pending_dialog = (show, title, message)
+
+def _refresh_ui():
+    # Runs on the Tk thread; worker threads only assign the globals above
+    global _pending_dialog
+    status_label.config(text=_status_text)
+    progress.config(maximum=_progress_maximum, value=_progress_value)
+    root.after(100, _refresh_ui)
+    # Dialogs block until dismissed, so the next refresh is scheduled first
+    if _pending_dialog is not None:
+        show, title, message = _pending_dialog
+        _pending_dialog = None
+        show(title, message)
 
 def show_credits():
     messagebox.showinfo(
         "Credits",
         "This application uses the following open source libraries:\n\n"
-        "- requests (Apache 2.0)\n"
-        "- pandas (BSD License)\n"
+        "- urllib3 (MIT License)\n"
+        "- stream-unzip (MIT License)\n"
         "- lxml (BSD License)\n"
         "- tkinter (Python Standard Library)\n\n"
         "Developed by Oscar G.C. (Ozkr16) and Johan C.A.\n\n"
@@ -237,45 +552,51 @@ def show_credits():
     )
 
 # === GUI Setup ===
-root = tk.Tk()
+if __name__ == "__main__":
+    # Required for ProcessPoolExecutor workers in the frozen (PyInstaller) build
+    multiprocessing.freeze_support()
+
+    root = tk.Tk()
+
+    input_mode = tk.StringVar(value="download")
+    local_zip_path = tk.StringVar()
 
-input_mode = tk.StringVar(value="download")
-local_zip_path = tk.StringVar()
+    root.title("Greatbatch Device Data Processor by Oscar G.C. (Ozkr16) and Johan C.A.")
+    root.geometry("580x430")
+    root.resizable(False, False)
 
-root.title("Greatbatch Device Data Processor by Oscar G.C. (Ozkr16) and Johan C.A.")
-root.geometry("580x430")
-root.resizable(False, False)
+    tk.Label(root, text="ZIP File URL:").pack(pady=(10, 0))
+    url_entry = tk.Entry(root, width=70)
+    url_entry.pack(pady=(0, 10))
 
-tk.Label(root, text="ZIP File URL:").pack(pady=(10, 0))
-url_entry = tk.Entry(root, width=70)
-url_entry.pack(pady=(0, 10))
+    tk.Label(root, text="Input Mode:").pack()
+    mode_frame = tk.Frame(root)
+    mode_frame.pack()
+    tk.Radiobutton(mode_frame, text="Download from URL", variable=input_mode, value="download", command=lambda: local_file_btn.config(state=tk.DISABLED)).pack(side=tk.LEFT)
+    tk.Radiobutton(mode_frame, text="Use Local ZIP File", variable=input_mode, value="local", command=lambda: local_file_btn.config(state=tk.NORMAL)).pack(side=tk.LEFT)
 
-tk.Label(root, text="Input Mode:").pack()
-mode_frame = tk.Frame(root)
-mode_frame.pack()
-tk.Radiobutton(mode_frame, text="Download from URL", variable=input_mode, value="download", command=lambda: local_file_btn.config(state=tk.DISABLED)).pack(side=tk.LEFT)
-tk.Radiobutton(mode_frame, text="Use Local ZIP File", variable=input_mode, value="local", command=lambda: local_file_btn.config(state=tk.NORMAL)).pack(side=tk.LEFT)
+    def choose_local_file():
+        path = filedialog.askopenfilename(filetypes=[("ZIP files", "*.zip")])
+        if path:
+            local_zip_path.set(path)
 
-def choose_local_file():
-    path = filedialog.askopenfilename(filetypes=[("ZIP files", "*.zip")])
-    if path:
-        local_zip_path.set(path)
+    local_file_btn = tk.Button(root, text="Choose Local ZIP File", command=choose_local_file, state=tk.DISABLED)
+    local_file_btn.pack(pady=(5, 10))
 
-local_file_btn = tk.Button(root, text="Choose Local ZIP File", command=choose_local_file, state=tk.DISABLED)
-local_file_btn.pack(pady=(5, 10))
+    tk.Button(root, text="Run", width=30, command=run_processing).pack(pady=(0, 5))
+    tk.Button(root, text="Cancel", width=30, command=cancel_process).pack(pady=(0, 5))
 
-tk.Button(root, text="Run", width=30, command=run_processing).pack(pady=(0, 5))
-tk.Button(root, text="Cancel", width=30, command=cancel_process).pack(pady=(0, 5))
+    cleanup_btn = tk.Button(root, text="Clean Up ZIP/XML", width=30, command=clean_up, state=tk.DISABLED)
+    cleanup_btn.pack(pady=(0, 5))
 
-cleanup_btn = tk.Button(root, text="Clean Up ZIP/XML", width=30, command=clean_up, state=tk.DISABLED)
-cleanup_btn.pack(pady=(0, 5))
+    tk.Button(root, text="Credits", width=30, command=show_credits).pack(pady=(0, 10))
 
-tk.Button(root, text="Credits", width=30, command=show_credits).pack(pady=(0, 10))
+    progress = ttk.Progressbar(root, length=480, mode='determinate')
+    progress.pack(pady=(0, 10))
 
-progress = ttk.Progressbar(root, length=480, mode='indeterminate')
-progress.pack(pady=(0, 10))
+    status_label = tk.Label(root, text="Idle", anchor='center')
+    status_label.pack(pady=(0, 10))
 
-status_label = tk.Label(root, text="Idle", anchor='center')
-status_label.pack(pady=(0, 10))
+    _refresh_ui()
 
-root.mainloop()
+    root.mainloop()